@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import pandas as pd
+
+# ==========================================
+# ISTORIC VERSIONAT AL EDITĂRILOR
+# ==========================================
+# Tabelul de bază nu se modifică niciodată. Fiecare versiune păstrează doar rândurile schimbate
+# (cheie = indexul rândului, valoare = tuplul de valori sau None pentru ștergere), așa că N versiuni
+# costă O(bază + suma delta-urilor). Un DataFrame complet se construiește doar la cerere.
+
+
+@dataclass(frozen=True)
+class Version:
+    changes: dict  # index rând -> tuplu de valori (adăugat/modificat) sau None (șters)
+    summary: dict  # {"adăugate": n, "modificate": n, "șterse": n}, față de versiunea anterioară
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+def _same(a, b):
+    """Compară două valori de celulă, tratând NaN/None/pd.NA ca egale între ele."""
+    a_na, b_na = pd.isna(a), pd.isna(b)
+    if a_na or b_na:
+        return a_na and b_na
+    return bool(a == b)
+
+
+class EditHistory:
+    """Jurnal de editări cu undo/redo, vizualizare la orice versiune și compactare."""
+
+    def __init__(self, base):
+        self.base = base
+        self.columns = list(base.columns)
+        self.versions = []
+        self.cursor = 0  # versiunea curentă (0 = tabelul de bază)
+        # Două sloturi separate, ca vizualizarea unei versiuni vechi să nu evacueze versiunea curentă
+        self._current = (0, base)
+        self._past = (0, base)
+
+    # --- Citire ---
+    def frame_at(self, version=None):
+        """Reconstruiește tabelul la versiunea cerută (implicit: cea curentă)."""
+        version = self.cursor if version is None else version
+        if not 0 <= version <= len(self.versions):
+            raise IndexError(f"Versiune inexistentă: {version}")
+        if version == 0:
+            return self.base
+        slot = "_current" if version == self.cursor else "_past"
+        if getattr(self, slot)[0] == version:
+            return getattr(self, slot)[1]
+
+        overrides = {}
+        for v in self.versions[:version]:
+            overrides.update(v.changes)
+
+        base_index = self.base.index
+        deleted = [k for k, v in overrides.items() if v is None and k in base_index]
+        modified = {k: v for k, v in overrides.items() if v is not None and k in base_index}
+        added = {k: v for k, v in overrides.items() if v is not None and k not in base_index}
+
+        df = self.base.drop(index=deleted)
+        if modified:
+            rows = pd.DataFrame(list(modified.values()), index=list(modified), columns=self.columns)
+            try:
+                df.loc[rows.index] = rows
+            except (TypeError, ValueError):
+                # O editare a schimbat tipul unei coloane (ex. None într-o coloană bool): lărgim la object
+                df = df.astype(object)
+                df.loc[rows.index] = rows
+        if added:
+            df = pd.concat([df, pd.DataFrame(list(added.values()), index=list(added), columns=self.columns)])
+
+        setattr(self, slot, (version, df))
+        return df
+
+    def frame(self):
+        return self.frame_at(self.cursor)
+
+    def _forget(self, version):
+        """Invalidează cache-urile pentru versiunile >= `version` (rescrise după o editare nouă)."""
+        for slot in ("_current", "_past"):
+            if getattr(self, slot)[0] >= version:
+                setattr(self, slot, (0, self.base))
+
+    def log(self):
+        """Auditul editărilor: (versiune, moment, sumar) pentru fiecare versiune."""
+        return [(i + 1, v.timestamp, v.summary) for i, v in enumerate(self.versions)]
+
+    # --- Scriere ---
+    def commit(self, edited):
+        """Înregistrează diferențele dintre `edited` și versiunea curentă. Întoarce False dacă nu s-a schimbat nimic."""
+        if list(edited.columns) != self.columns:
+            raise ValueError("Coloanele tabelului editat diferă de cele ale tabelului de bază.")
+
+        current = self.frame()
+        # Verificare ieftină la fiecare rulare; diferența pe rânduri se calculează doar dacă ceva s-a schimbat
+        if edited.equals(current):
+            return False
+        cur_rows = dict(zip(current.index, current.itertuples(index=False, name=None)))
+        new_rows = dict(zip(edited.index, edited.itertuples(index=False, name=None)))
+
+        # Clasificăm față de versiunea curentă (nu față de bază), ca auditul să fie corect
+        changes = {k: None for k in cur_rows if k not in new_rows}
+        summary = {"adăugate": 0, "modificate": 0, "șterse": len(changes)}
+        for k, row in new_rows.items():
+            old = cur_rows.get(k)
+            if old is None:
+                changes[k] = row
+                summary["adăugate"] += 1
+            elif not all(_same(a, b) for a, b in zip(old, row)):
+                changes[k] = row
+                summary["modificate"] += 1
+        if not changes:
+            return False
+
+        # O editare nouă după undo anulează ramura de redo
+        old_cursor, redo_branch = self.cursor, self.versions[self.cursor:]
+        del self.versions[self.cursor:]
+        self.versions.append(Version(changes, summary))
+        self.cursor = len(self.versions)
+        self._forget(self.cursor)
+
+        # Reconstruim imediat versiunea nouă: o editare care nu poate fi reaplicată e respinsă,
+        # altfel fiecare frame() ulterior ar eșua
+        try:
+            self.frame()
+        except (TypeError, ValueError) as e:
+            del self.versions[old_cursor:]
+            self.versions.extend(redo_branch)
+            self.cursor = old_cursor
+            raise ValueError(f"Editarea nu poate fi aplicată: {e}") from e
+        return True
+
+    def undo(self):
+        if self.can_undo():
+            self.cursor -= 1
+
+    def redo(self):
+        if self.can_redo():
+            self.cursor += 1
+
+    def can_undo(self):
+        return self.cursor > 0
+
+    def can_redo(self):
+        return self.cursor < len(self.versions)
+
+    def compact(self):
+        """Versiunea curentă devine noul tabel de bază; istoricul (inclusiv redo) se golește."""
+        self.base = self.frame()
+        self.versions = []
+        self.cursor = 0
+        self._current = self._past = (0, self.base)
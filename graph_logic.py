@@ -0,0 +1,124 @@
+import pandas as pd
+
+# ==========================================
+# LOGICA DE GRAF (fără Streamlit)
+# ==========================================
+# Folosită atât de streamlit_app.py, cât și de render_snapshots.py (randare headless).
+
+ALL_LABEL = "- Toate -"
+COLUMNS = ["Partner", "Domain_Raw", "Ukraine", "Strategic", "Description"]
+
+
+def read_data(path="data.csv"):
+    """Citește și normalizează CSV-ul de parteneri."""
+    try:
+        df = pd.read_csv(path, skipinitialspace=True).replace(r'\n', ' ', regex=True)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=COLUMNS)
+
+    # Normalizări
+    df.columns = [c.strip() for c in df.columns]
+    for col in ["Ukraine", "Strategic"]:
+        if col not in df.columns: df[col] = False
+        df[col] = df[col].apply(lambda x: str(x).strip().lower() in ["da", "true", "x", "1", "yes"])
+
+    if "Description" not in df.columns: df["Description"] = "Fără descriere."
+    df["Description"] = df["Description"].fillna("-")
+    return df
+
+
+def process_graph_data(df):
+    """Transformă DataFrame-ul în structuri de graf (Noduri și Muchii)."""
+    nodes, edges = {}, []
+
+    for idx, row in df.iterrows():
+        p_id, p_name = f"p_{idx}", str(row["Partner"])
+        # Nod Partener
+        nodes[p_id] = {
+            "label": p_name, "type": "Partner", "ukraine": row["Ukraine"],
+            "strategic": row["Strategic"], "desc": row["Description"]
+        }
+
+        # Procesare Domenii
+        raw_domains = str(row["Domain_Raw"]).replace("\n", "/").replace("|", "/").split("/")
+        for d in [map_domain_category(x.strip()) for x in raw_domains if x.strip()]:
+            d_id = f"d_{d}"
+            if d_id not in nodes:
+                nodes[d_id] = {"label": d, "type": "Domain"}
+            edges.append((p_id, d_id))
+
+    return nodes, edges
+
+
+def map_domain_category(t):
+    t = t.lower()
+    mapping = {
+        "chimice": "Dezastre chimice", "it": "IT & C", "smart": "IT & C",
+        "salvare": "Căutare-salvare", "restabilirea": "Restabilirea stării de normalitate",
+        "sociale": "Servicii sociale", "logistic": "Sprijin logistic", "răspuns": "Răspuns",
+        "traum": "Răspuns", "prevenire": "Prevenire", "pregătire": "Pregătire",
+        "studenți": "Pregătire", "cercetare": "Cercetare", "intervenție": "Intervenție"
+    }
+    for k, v in mapping.items():
+        if k in t: return v
+    return t.title()
+
+
+def find_node_id(nodes_dict, label):
+    return next((nid for nid, n in nodes_dict.items() if n["label"] == label), None)
+
+
+def compute_visible_ids(nodes_dict, edges_list, filter_domains, focus_node_id=None,
+                        only_strategic=False, only_ukraine=False):
+    """Decide ce noduri sunt vizibile (focus pe un partener sau filtrare după domenii)."""
+    visible_ids = set()
+
+    if focus_node_id:
+        # MOD FOCUS: Partenerul + Vecinii săi
+        visible_ids.add(focus_node_id)
+        for s, t in edges_list:
+            if s == focus_node_id: visible_ids.add(t)
+            elif t == focus_node_id: visible_ids.add(s)
+    else:
+        # MOD GENERAL: Filtrare după Domenii
+        domain_ids = {nid for nid, n in nodes_dict.items() if n["type"] == "Domain" and n["label"] in filter_domains}
+        visible_ids.update(domain_ids)
+        # Adăugăm partenerii conectați la domeniile vizibile
+        visible_ids.update({s for s, t in edges_list if t in domain_ids})
+
+    # Filtre pe atribute (Strategic / Ucraina), în ambele moduri: păstrăm doar partenerii care le respectă
+    # și domeniile vizibile care mai au cel puțin un partener vizibil
+    if only_strategic or only_ukraine:
+        partners = {nid for nid in visible_ids if nodes_dict[nid]["type"] == "Partner"
+                    and (not only_strategic or nodes_dict[nid]["strategic"])
+                    and (not only_ukraine or nodes_dict[nid]["ukraine"])}
+        visible_ids = partners | {t for s, t in edges_list if s in partners and t in visible_ids}
+
+    return visible_ids
+
+
+def build_viz_elements(nodes_dict, edges_list, visible_ids, focus_node_id=None):
+    """Construiește atributele vizuale (dict-uri compatibile cu Node/Edge din agraph) pentru nodurile vizibile."""
+    viz_nodes, viz_edges = [], []
+
+    # Calculăm gradul (conectivitatea) pentru mărime
+    degrees = {n: 0 for n in nodes_dict}
+    for s, t in edges_list:
+        degrees[s] += 1; degrees[t] += 1
+
+    # Ordine stabilă, ca aceleași date să producă același rezultat (important pentru hash-uri)
+    for nid in sorted(visible_ids):
+        n = nodes_dict[nid]
+        if n["type"] == "Partner":
+            size = 40 if nid == focus_node_id else (14 + degrees[nid] * 0.5)
+            color = "#ffd700" if n["strategic"] else "#00f2c3"
+            viz_nodes.append(dict(id=nid, label=n["label"][:20]+".." if len(n["label"])>20 and nid != focus_node_id else n["label"],
+                                  size=size, shape="dot", color=color, title=n["label"], font={"color": "white"}))
+        else:
+            viz_nodes.append(dict(id=nid, label=n["label"], size=20 + degrees[nid], shape="diamond", color="#fd79a8", font={"color": "#ffeef6"}))
+
+    for s, t in edges_list:
+        if s in visible_ids and t in visible_ids:
+            viz_edges.append(dict(source=s, target=t, color="#2d3436"))
+
+    return viz_nodes, viz_edges
@@ -0,0 +1,268 @@
+"""Randare headless (fără Streamlit) a unor vederi fixe ale grafului în fișiere HTML/JSON statice.
+
+Exemple:
+    python render_snapshots.py                      # vederile implicite în ./snapshots
+    python render_snapshots.py --views views.json   # vederi definite de utilizator
+    python render_snapshots.py --force --workers 8
+
+Fișierul de vederi este o listă JSON de obiecte:
+    {"name": "...", "domains": [...] | null, "focus": "Partener" | null, "strategic": bool, "ukraine": bool}
+
+Fiecare vedere primește un hash al conținutului (subgraful vizibil + stil + versiunea randării),
+salvat în manifest.json. Vederile al căror hash nu s-a schimbat nu mai sunt randate.
+"""
+import argparse
+import hashlib
+import html
+import json
+import math
+import os
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from graph_logic import read_data, process_graph_data, find_node_id, compute_visible_ids, build_viz_elements
+
+# Se incrementează la orice schimbare de layout / format, ca să invalideze toate snapshot-urile
+RENDER_VERSION = 1
+MANIFEST = "manifest.json"
+WIDTH, HEIGHT, RADIUS = 1400, 750, 300
+
+
+# ==========================================
+# 1. DEFINIREA VEDERILOR
+# ==========================================
+def slugify(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def default_views(all_domains):
+    """Ecosistemul complet, doar strategici, partenerii Ucraina și câte o vedere per domeniu."""
+    views = [
+        {"name": "toate"},
+        {"name": "strategic", "strategic": True},
+        {"name": "ucraina", "ukraine": True},
+    ]
+    # Etichete diferite pot da același slug ("IT & C" / "IT C") sau unul gol; adăugăm un sufix numeric
+    taken = {v["name"] for v in views}
+    for d in all_domains:
+        slug = f"domeniu-{slugify(d) or 'fara-nume'}"
+        name, i = slug, 2
+        while name in taken:
+            name, i = f"{slug}-{i}", i + 1
+        taken.add(name)
+        views.append({"name": name, "domains": [d]})
+    return views
+
+
+def validate_views(views):
+    """Verifică structura (listă de obiecte) și numele vederilor, care devin nume de fișiere:
+    trebuie să fie slug-uri unice, diferite de manifest."""
+    if not isinstance(views, list) or not all(isinstance(v, dict) for v in views):
+        raise ValueError("Fișierul de vederi trebuie să conțină o listă de obiecte JSON.")
+    names = [v.get("name") for v in views]
+    for name in names:
+        if not isinstance(name, str) or not name or slugify(name) != name:
+            raise ValueError(f"Nume de vedere invalid: {name!r} (folosiți doar a-z, 0-9 și '-').")
+        if name == os.path.splitext(MANIFEST)[0]:
+            raise ValueError(f"Numele {name!r} este rezervat pentru manifest.")
+    if len(set(names)) != len(names):
+        raise ValueError("Numele vederilor trebuie să fie unice.")
+
+
+def build_payload(view, nodes_dict, edges_list, all_domains):
+    """Aplică logica de vizibilitate și întoarce tot ce are nevoie randarea (fără referințe la DataFrame)."""
+    focus_node_id = None
+    if view.get("focus"):
+        partners = {nid: n for nid, n in nodes_dict.items() if n["type"] == "Partner"}
+        focus_node_id = find_node_id(partners, view["focus"])
+        if focus_node_id is None:
+            raise ValueError(f"Vederea {view['name']!r}: partenerul {view['focus']!r} nu există în date.")
+    # Doar lipsa cheii (sau null) înseamnă "toate domeniile"; o listă goală rămâne goală
+    domains = all_domains if view.get("domains") is None else view["domains"]
+    if not isinstance(domains, list):
+        raise ValueError(f"Vederea {view['name']!r}: \"domains\" trebuie să fie o listă sau null.")
+    unknown = [d for d in domains if d not in all_domains]
+    if unknown:
+        raise ValueError(f"Vederea {view['name']!r}: domenii inexistente în date: {unknown}.")
+    visible_ids = compute_visible_ids(nodes_dict, edges_list, domains, focus_node_id,
+                                      only_strategic=view.get("strategic", False),
+                                      only_ukraine=view.get("ukraine", False))
+    viz_nodes, viz_edges = build_viz_elements(nodes_dict, edges_list, visible_ids, focus_node_id)
+    return {"view": view, "nodes": viz_nodes, "edges": viz_edges}
+
+
+def payload_hash(payload):
+    blob = json.dumps([RENDER_VERSION, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# ==========================================
+# 2. LAYOUT (POZIȚII PRECALCULATE)
+# ==========================================
+def compute_positions(nodes, edges):
+    """Layout determinist: domeniile pe un cerc, partenerii grupați în jurul centrului domeniilor lor."""
+    domain_ids = [n["id"] for n in nodes if n["shape"] == "diamond"]
+    radius = RADIUS if len(domain_ids) > 1 else 0
+    pos = {}
+    for i, nid in enumerate(domain_ids):
+        angle = 2 * math.pi * i / len(domain_ids)
+        pos[nid] = (round(radius * math.cos(angle), 1), round(radius * math.sin(angle), 1))
+
+    links = {}
+    for e in edges:
+        links.setdefault(e["source"], []).append(e["target"])
+
+    # Partenerii cu același set de domenii împart centrul și sunt așezați pe o spirală (unghiul de aur)
+    groups = {}
+    for n in nodes:
+        if n["id"] not in pos:
+            groups.setdefault(tuple(sorted(links.get(n["id"], []))), []).append(n["id"])
+    golden = math.pi * (3 - math.sqrt(5))
+    for key, members in groups.items():
+        anchors = [pos[d] for d in key] or [(0.0, 0.0)]
+        cx = sum(x for x, _ in anchors) / len(anchors)
+        cy = sum(y for _, y in anchors) / len(anchors)
+        # Îndepărtăm grupul de domeniul propriu, ca să nu se suprapună cu nodul-domeniu
+        base = 60 if len(key) == 1 else 0
+        for i, nid in enumerate(members):
+            r, a = base + 28 * math.sqrt(i + 1), i * golden
+            pos[nid] = (round(cx + r * math.cos(a), 1), round(cy + r * math.sin(a), 1))
+
+    return pos
+
+
+# ==========================================
+# 3. RANDARE (rulează în procesele din pool)
+# ==========================================
+def render_svg(nodes, edges, pos):
+    xs = [x for x, _ in pos.values()] or [0]
+    ys = [y for _, y in pos.values()] or [0]
+    pad = 80
+    vb = f"{min(xs) - pad:g} {min(ys) - pad:g} {max(xs) - min(xs) + 2 * pad:g} {max(ys) - min(ys) + 2 * pad:g}"
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{vb}" width="{WIDTH}" height="{HEIGHT}">']
+    for e in edges:
+        (x1, y1), (x2, y2) = pos[e["source"]], pos[e["target"]]
+        parts.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{e["color"]}" stroke-width="1.5"/>')
+    for n in nodes:
+        x, y = pos[n["id"]]
+        r = n["size"] / 2
+        title = html.escape(n.get("title", n["label"]))
+        if n["shape"] == "diamond":
+            shape = f'<polygon points="{x},{y - r} {x + r},{y} {x},{y + r} {x - r},{y}" fill="{n["color"]}"/>'
+        else:
+            shape = f'<circle cx="{x}" cy="{y}" r="{r}" fill="{n["color"]}"/>'
+        label = (f'<text x="{x}" y="{y + r + 12}" fill="{n["font"]["color"]}" font-size="11" '
+                 f'text-anchor="middle">{html.escape(n["label"])}</text>')
+        parts.append(f'<g><title>{title}</title>{shape}{label}</g>')
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def render_view(job):
+    """Calculează pozițiile și scrie <name>.html + <name>.json. Întoarce numele vederii."""
+    payload, out_dir = job
+    name, nodes, edges = payload["view"]["name"], payload["nodes"], payload["edges"]
+    pos = compute_positions(nodes, edges)
+
+    snapshot = {
+        "view": payload["view"],
+        "nodes": [dict(n, x=pos[n["id"]][0], y=pos[n["id"]][1]) for n in nodes],
+        "edges": edges,
+    }
+    with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=1)
+
+    page = f"""<!DOCTYPE html>
+<html lang="ro"><head><meta charset="utf-8"><title>Ecosistem DSU - {html.escape(name)}</title>
+<style>body {{ background-color: #0E1117; color: #F0F2F6; font-family: "Helvetica Neue", Arial, sans-serif; margin: 1rem; }}</style>
+</head><body>
+<h3>{html.escape(name)}</h3>
+{render_svg(nodes, edges, pos)}
+</body></html>
+"""
+    with open(os.path.join(out_dir, f"{name}.html"), "w", encoding="utf-8") as f:
+        f.write(page)
+    return name
+
+
+# ==========================================
+# 4. ORCHESTRARE
+# ==========================================
+def render_all(df, views, out_dir, workers=None, force=False):
+    """Randează vederile modificate. Întoarce (randate, sărite)."""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+
+    # Graful complet se construiește o singură dată; vizibilitatea per vedere e ieftină
+    nodes_dict, edges_list = process_graph_data(df)
+    all_domains = sorted([n["label"] for n in nodes_dict.values() if n["type"] == "Domain"])
+
+    jobs, hashes, skipped = [], {}, []
+    for view in views:
+        payload = build_payload(view, nodes_dict, edges_list, all_domains)
+        name = view["name"]
+        hashes[name] = payload_hash(payload)
+        up_to_date = all(os.path.exists(os.path.join(out_dir, f"{name}.{ext}")) for ext in ("html", "json"))
+        if not force and up_to_date and manifest.get(name) == hashes[name]:
+            skipped.append(name)
+        else:
+            jobs.append((payload, out_dir))
+
+    if workers == 1 or len(jobs) <= 1:
+        rendered = [render_view(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(render_view, jobs, chunksize=max(1, len(jobs) // 32)))
+
+    # Vederile care nu mai sunt cerute (sau domeniile dispărute) nu lasă snapshot-uri vechi în urmă
+    for name in set(manifest) - set(hashes):
+        for ext in ("html", "json"):
+            path = os.path.join(out_dir, f"{name}.{ext}")
+            if os.path.exists(path):
+                os.remove(path)
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(hashes, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return rendered, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generează snapshot-uri statice (HTML/JSON) ale grafului DSU.")
+    parser.add_argument("--data", default="data.csv", help="CSV-ul de parteneri (implicit: data.csv)")
+    parser.add_argument("--out", default="snapshots", help="Directorul de ieșire (implicit: snapshots)")
+    parser.add_argument("--views", help="Fișier JSON cu lista de vederi (implicit: vederile standard)")
+    parser.add_argument("--workers", type=int, default=None, help="Număr de procese (implicit: nr. de CPU)")
+    parser.add_argument("--force", action="store_true", help="Randează tot, ignorând hash-urile")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers trebuie să fie cel puțin 1.")
+
+    df = read_data(args.data)
+    try:
+        if args.views:
+            try:
+                with open(args.views, encoding="utf-8") as f:
+                    views = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                raise ValueError(f"Nu pot citi fișierul de vederi {args.views!r}: {e}") from e
+        else:
+            nodes_dict, _ = process_graph_data(df)
+            views = default_views(sorted({n["label"] for n in nodes_dict.values() if n["type"] == "Domain"}))
+
+        validate_views(views)
+        rendered, skipped = render_all(df, views, args.out, workers=args.workers, force=args.force)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"{len(rendered)} randate, {len(skipped)} neschimbate -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
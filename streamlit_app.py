@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
 from streamlit_agraph import agraph, Node, Edge, Config
 
+from edit_history import EditHistory
+from graph_logic import ALL_LABEL, read_data, process_graph_data, find_node_id, compute_visible_ids, build_viz_elements
+
 # ==========================================
 # 1. CONFIGURARE & STIL (UI SETUP)
 # ==========================================
@@ -23,98 +25,49 @@ st.markdown("""
 # ==========================================
 @st.cache_data
 def load_data():
-    try:
-        df = pd.read_csv("data.csv", skipinitialspace=True).replace(r'\n', ' ', regex=True)
-    except FileNotFoundError:
-        return pd.DataFrame(columns=["Partner", "Domain_Raw", "Ukraine", "Strategic", "Description"])
-    
-    # Normalizări
-    df.columns = [c.strip() for c in df.columns]
-    for col in ["Ukraine", "Strategic"]:
-        if col not in df.columns: df[col] = False
-        df[col] = df[col].apply(lambda x: str(x).strip().lower() in ["da", "true", "x", "1", "yes"])
-    
-    if "Description" not in df.columns: df["Description"] = "Fără descriere."
-    df["Description"] = df["Description"].fillna("-")
-    return df
-
-def process_graph_data(df):
-    """Transformă DataFrame-ul în structuri de graf (Noduri și Muchii)."""
-    nodes, edges = {}, []
-    
-    for idx, row in df.iterrows():
-        p_id, p_name = f"p_{idx}", str(row["Partner"])
-        # Nod Partener
-        nodes[p_id] = {
-            "label": p_name, "type": "Partner", "ukraine": row["Ukraine"],
-            "strategic": row["Strategic"], "desc": row["Description"]
-        }
-        
-        # Procesare Domenii
-        raw_domains = str(row["Domain_Raw"]).replace("\n", "/").replace("|", "/").split("/")
-        for d in [map_domain_category(x.strip()) for x in raw_domains if x.strip()]:
-            d_id = f"d_{d}"
-            if d_id not in nodes:
-                nodes[d_id] = {"label": d, "type": "Domain"}
-            edges.append((p_id, d_id))
-            
-    return nodes, edges
-
-def map_domain_category(t):
-    t = t.lower()
-    mapping = {
-        "chimice": "Dezastre chimice", "it": "IT & C", "smart": "IT & C",
-        "salvare": "Căutare-salvare", "restabilirea": "Restabilirea stării de normalitate",
-        "sociale": "Servicii sociale", "logistic": "Sprijin logistic", "răspuns": "Răspuns",
-        "traum": "Răspuns", "prevenire": "Prevenire", "pregătire": "Pregătire",
-        "studenți": "Pregătire", "cercetare": "Cercetare", "intervenție": "Intervenție"
-    }
-    for k, v in mapping.items():
-        if k in t: return v
-    return t.title()
+    return read_data("data.csv")
 
 # ==========================================
 # 3. STATE MANAGEMENT
 # ==========================================
-if "main_df" not in st.session_state:
-    st.session_state["main_df"] = load_data()
+# Istoricul editărilor: tabel de bază imuabil + delta-uri pe rânduri (undo/redo, versiuni)
+if "history" not in st.session_state:
+    st.session_state["history"] = EditHistory(load_data())
+history = st.session_state["history"]
+st.session_state["main_df"] = history.frame()
+
+# Versiunea afișată în graf (implicit cea curentă; poate fi una mai veche, doar pentru vizualizare)
+view_version = st.session_state.get("view_version")
+if view_version is None or view_version > len(history.versions):
+    view_version = history.cursor
 
 # Master Selection: Controlează cine e focusat (din Search sau Click pe graf)
 if "master_selection" not in st.session_state:
-    st.session_state["master_selection"] = "- Toate -"
+    st.session_state["master_selection"] = ALL_LABEL
 
 # Recalculăm graful complet la fiecare rulare pe baza datelor (care pot fi editate)
-nodes_dict, edges_list = process_graph_data(st.session_state["main_df"])
+nodes_dict, edges_list = process_graph_data(history.frame_at(view_version))
 all_partners = sorted([n["label"] for n in nodes_dict.values() if n["type"] == "Partner"])
 all_domains = sorted([n["label"] for n in nodes_dict.values() if n["type"] == "Domain"])
 
 if "filter_domains" not in st.session_state:
     st.session_state["filter_domains"] = all_domains
 
+# O versiune mai veche (sau o ștergere) poate să nu mai conțină partenerul / domeniile selectate.
+# Nu rescriem session_state: alegerile salvate se schimbă doar din widget-uri, ca să reapară la revenire.
+selection = st.session_state["master_selection"] if st.session_state["master_selection"] in all_partners else ALL_LABEL
+active_domains = [d for d in st.session_state["filter_domains"] if d in all_domains]
+domain_options = sorted(set(all_domains) | set(st.session_state["filter_domains"]))
+
 # ==========================================
 # 4. LOGICA DE FILTRARE (VISIBILITY ENGINE)
 # ==========================================
-# Aceasta este "inima" logicii: decidem ce noduri sunt vizibile
-visible_ids = set()
-focus_node_id = None
-is_focused = st.session_state["master_selection"] != "- Toate -"
+# Aceasta este "inima" logicii: decidem ce noduri sunt vizibile (vezi graph_logic.py)
+is_focused = selection != ALL_LABEL
 
 # Găsim ID-ul nodului focusat (dacă există)
-if is_focused:
-    focus_node_id = next((nid for nid, n in nodes_dict.items() if n["label"] == st.session_state["master_selection"]), None)
-
-if is_focused and focus_node_id:
-    # MOD FOCUS: Partenerul + Vecinii săi
-    visible_ids.add(focus_node_id)
-    for s, t in edges_list:
-        if s == focus_node_id: visible_ids.add(t)
-        elif t == focus_node_id: visible_ids.add(s)
-else:
-    # MOD GENERAL: Filtrare după Domenii
-    domain_ids = {nid for nid, n in nodes_dict.items() if n["type"] == "Domain" and n["label"] in st.session_state["filter_domains"]}
-    visible_ids.update(domain_ids)
-    # Adăugăm partenerii conectați la domeniile vizibile
-    visible_ids.update({s for s, t in edges_list if t in domain_ids})
+focus_node_id = find_node_id(nodes_dict, selection) if is_focused else None
+visible_ids = compute_visible_ids(nodes_dict, edges_list, active_domains, focus_node_id)
 
 # ==========================================
 # 5. LAYOUT UI
@@ -129,8 +82,8 @@ with col_ctrl:
     def update_selection():
         st.session_state["master_selection"] = st.session_state["dropdown_box"]
     
-    curr_idx = all_partners.index(st.session_state["master_selection"]) + 1 if is_focused else 0
-    st.selectbox("Caută Organizație:", ["- Toate -"] + all_partners, index=curr_idx, key="dropdown_box", on_change=update_selection)
+    curr_idx = all_partners.index(selection) + 1 if is_focused else 0
+    st.selectbox("Caută Organizație:", [ALL_LABEL] + all_partners, index=curr_idx, key="dropdown_box", on_change=update_selection)
 
     st.divider()
 
@@ -140,10 +93,10 @@ with col_ctrl:
         with st.expander("Filtrare Domenii", expanded=True):
             if st.button("Select All"): st.session_state["filter_domains"] = all_domains; st.rerun()
             if st.button("Deselect All"): st.session_state["filter_domains"] = []; st.rerun()
-            st.multiselect("Domenii:", all_domains, key="filter_domains", label_visibility="collapsed")
+            st.multiselect("Domenii:", domain_options, key="filter_domains", label_visibility="collapsed")
     else:
         if st.button("⬅️ Vezi tot ecosistemul"):
-            st.session_state["master_selection"] = "- Toate -"
+            st.session_state["master_selection"] = ALL_LABEL
             st.rerun()
 
     st.divider()
@@ -170,26 +123,9 @@ with col_ctrl:
 # --- RIGHT PANEL: GRAPH ---
 with col_graph:
     # Construim obiectele vizuale DOAR pentru nodurile vizibile
-    viz_nodes, viz_edges = [], []
-    
-    # Calculăm gradul (conectivitatea) pentru mărime
-    degrees = {n: 0 for n in nodes_dict}
-    for s, t in edges_list:
-        degrees[s] += 1; degrees[t] += 1
-
-    for nid in visible_ids:
-        n = nodes_dict[nid]
-        if n["type"] == "Partner":
-            size = 40 if nid == focus_node_id else (14 + degrees[nid] * 0.5)
-            color = "#ffd700" if n["strategic"] else "#00f2c3"
-            viz_nodes.append(Node(id=nid, label=n["label"][:20]+".." if len(n["label"])>20 and nid != focus_node_id else n["label"], 
-                                  size=size, shape="dot", color=color, title=n["label"], font={"color": "white"}))
-        else:
-            viz_nodes.append(Node(id=nid, label=n["label"], size=20 + degrees[nid], shape="diamond", color="#fd79a8", font={"color": "#ffeef6"}))
-
-    for s, t in edges_list:
-        if s in visible_ids and t in visible_ids:
-            viz_edges.append(Edge(source=s, target=t, color="#2d3436"))
+    node_attrs, edge_attrs = build_viz_elements(nodes_dict, edges_list, visible_ids, focus_node_id)
+    viz_nodes = [Node(**a) for a in node_attrs]
+    viz_edges = [Edge(**a) for a in edge_attrs]
 
     # Configurare Grafic
     config = Config(width=1400, height=750, directed=False, physics=True, nodeHighlightBehavior=True, highlightColor="#F7A072",
@@ -209,7 +145,31 @@ with col_graph:
 # ==========================================
 st.divider()
 with st.expander("Editor Date (Live Update)"):
+    c1, c2, c3 = st.columns(3)
+    if c1.button("↶ Undo", disabled=not history.can_undo()):
+        history.undo(); st.session_state["view_version"] = None; st.rerun()
+    if c2.button("↷ Redo", disabled=not history.can_redo()):
+        history.redo(); st.session_state["view_version"] = None; st.rerun()
+    if c3.button("Compactează istoricul", disabled=not history.versions):
+        history.compact(); st.session_state["view_version"] = None; st.rerun()
+
+    if history.versions:
+        # Time-travel: graful de mai sus afișează versiunea aleasă, fără a schimba datele curente
+        picked = st.select_slider("Versiune afișată în graf:", options=list(range(len(history.versions) + 1)), value=view_version)
+        if picked != view_version:
+            st.session_state["view_version"] = None if picked == history.cursor else picked
+            st.rerun()
+        with st.expander("Istoric modificări"):
+            for v, ts, summary in history.log():
+                marker = " (curentă)" if v == history.cursor else ""
+                st.markdown(f"- **v{v}**{marker} {ts:%H:%M:%S}: " + ", ".join(f"{n} {k}" for k, n in summary.items()))
+
     edited = st.data_editor(st.session_state["main_df"], num_rows="dynamic", use_container_width=True, key="editor")
-    if not edited.equals(st.session_state["main_df"]):
-        st.session_state["main_df"] = edited
+    try:
+        changed = history.commit(edited)
+    except ValueError as e:
+        st.error(str(e))
+        changed = False
+    if changed:
+        st.session_state["view_version"] = None
         st.rerun()
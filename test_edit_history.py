@@ -0,0 +1,134 @@
+import pandas as pd
+import pytest
+
+from edit_history import EditHistory
+
+
+@pytest.fixture
+def base():
+    return pd.DataFrame({
+        "Partner": ["A", "B", "C"],
+        "Domain_Raw": ["Prevenire", "Intervenție", "Cercetare"],
+        "Ukraine": [True, False, False],
+        "Strategic": [False, True, False],
+        "Description": ["a", "b", "c"],
+    })
+
+
+def test_commit_without_changes_is_noop(base):
+    h = EditHistory(base)
+    assert not h.commit(base.copy())
+    assert h.versions == [] and h.cursor == 0
+
+
+def test_commit_records_row_deltas_and_summary(base):
+    h = EditHistory(base)
+    df = base.copy()
+    df.loc[0, "Strategic"] = True
+    df = df.drop(index=[1])
+    df.loc[3] = ["D", "Pregătire", False, False, "d"]
+    assert h.commit(df)
+
+    assert set(h.versions[0].changes) == {0, 1, 3}
+    assert h.log()[0][2] == {"adăugate": 1, "modificate": 1, "șterse": 1}
+    assert h.frame()["Partner"].tolist() == ["A", "C", "D"]
+    assert h.frame().loc[0, "Strategic"]
+    # Tabelul de bază rămâne neschimbat
+    assert base["Partner"].tolist() == ["A", "B", "C"] and not base.loc[0, "Strategic"]
+
+
+def test_summary_is_relative_to_previous_version(base):
+    h = EditHistory(base)
+    df = base.copy()
+    df.loc[3] = ["D", "Pregătire", False, False, "d"]
+    h.commit(df)
+    df = h.frame().copy()
+    df.loc[3, "Partner"] = "E"
+    df = df.drop(index=[0])
+    h.commit(df)
+    df = h.frame().copy()
+    df.loc[0] = base.loc[0].tolist()
+    h.commit(df)
+
+    assert [s for _, _, s in h.log()] == [
+        {"adăugate": 1, "modificate": 0, "șterse": 0},
+        {"adăugate": 0, "modificate": 1, "șterse": 1},
+        {"adăugate": 1, "modificate": 0, "șterse": 0},
+    ]
+    assert h.frame().loc[3, "Partner"] == "E"
+    assert 0 in h.frame().index
+
+
+def test_undo_redo_and_time_travel(base):
+    h = EditHistory(base)
+    for name in ["X", "Y"]:
+        df = h.frame().copy()
+        df.loc[0, "Partner"] = name
+        h.commit(df)
+
+    assert [h.frame_at(v).loc[0, "Partner"] for v in range(3)] == ["A", "X", "Y"]
+    h.undo()
+    assert h.frame().loc[0, "Partner"] == "X" and h.can_redo()
+    h.redo()
+    assert h.frame().loc[0, "Partner"] == "Y" and not h.can_redo()
+    with pytest.raises(IndexError):
+        h.frame_at(3)
+
+
+def test_commit_after_undo_truncates_redo_branch(base):
+    h = EditHistory(base)
+    for name in ["X", "Y"]:
+        df = h.frame().copy()
+        df.loc[0, "Partner"] = name
+        h.commit(df)
+
+    h.undo()
+    # Vizualizăm versiunea 2 dintr-o versiune anterioară, ca să ajungă în slotul de time-travel
+    assert h.frame_at(2).loc[0, "Partner"] == "Y"
+    df = h.frame().copy()
+    df.loc[0, "Partner"] = "Z"
+    h.commit(df)
+
+    assert len(h.versions) == 2 and not h.can_redo()
+    # Versiunea 2 a fost rescrisă: cache-ul vechi nu trebuie refolosit
+    h.undo()
+    assert h.frame_at(2).loc[0, "Partner"] == "Z"
+
+
+def test_compact_folds_log_into_new_base(base):
+    h = EditHistory(base)
+    df = base.drop(index=[1])
+    h.commit(df)
+    h.compact()
+
+    assert h.versions == [] and h.cursor == 0 and not h.can_undo()
+    assert h.frame()["Partner"].tolist() == ["A", "C"]
+    assert h.frame() is h.base
+
+
+def test_commit_that_changes_column_type(base):
+    h = EditHistory(base)
+    df = base.copy()
+    df["Ukraine"] = df["Ukraine"].astype(object)
+    df.loc[1, "Ukraine"] = None
+    assert h.commit(df)
+
+    assert h.frame().loc[1, "Ukraine"] is None
+    assert h.frame().loc[0, "Ukraine"]
+    assert h.frame_at(0)["Ukraine"].dtype == bool
+
+
+def test_pd_na_values_are_compared_safely(base):
+    base = base.astype({"Description": "string"})
+    h = EditHistory(base)
+    df = base.copy()
+    df.loc[1, "Description"] = pd.NA
+    assert h.commit(df)
+    assert pd.isna(h.frame().loc[1, "Description"])
+    assert not h.commit(h.frame().copy())
+
+
+def test_commit_rejects_different_columns(base):
+    h = EditHistory(base)
+    with pytest.raises(ValueError):
+        h.commit(base.drop(columns=["Description"]))